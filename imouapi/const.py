@@ -15,6 +15,9 @@ CAMERA_WAIT_BEFORE_DOWNLOAD = 1.5
 # for dormant devices for how long to wait in seconds after waking the device up
 WAIT_AFTER_WAKE_UP = 4.0
 
+# minimum time in seconds between two updates of the sensors of a device (0 to always update them)
+UPDATE_TTL = 0.0
+
 # PTZ operation mapping
 PTZ_OPERATIONS = {
     "UP": 0,
@@ -290,6 +293,9 @@ IMOU_SWITCHES = {
     "pushNotifications": "Push notifications",
 }
 
+# Imou switches indexed by their lowercase name, to match them against the device capabilities
+IMOU_SWITCHES_LOWER = {switch_type.lower(): switch_type for switch_type in IMOU_SWITCHES}
+
 # sensors supported by this library
 SENSORS = {
     "storageUsed": "Storage used",
@@ -326,3 +332,13 @@ CAMERAS = {
     "camera": "Camera (HD)",
     "cameraSD": "Camera (SD)",
 }
+
+# descriptions in the format "<description> (<name>)" used for diagnostics
+IMOU_CAPABILITIES_DESC = {name: f"{description} ({name})" for name, description in IMOU_CAPABILITIES.items()}
+IMOU_SWITCHES_DESC = {name: f"{description} ({name})" for name, description in IMOU_SWITCHES.items()}
+SENSORS_DESC = {name: f"{description} ({name})" for name, description in SENSORS.items()}
+BINARY_SENSORS_DESC = {name: f"{description} ({name})" for name, description in BINARY_SENSORS.items()}
+SELECT_DESC = {name: f"{description} ({name})" for name, description in SELECT.items()}
+BUTTONS_DESC = {name: f"{description} ({name})" for name, description in BUTTONS.items()}
+SIRENS_DESC = {name: f"{description} ({name})" for name, description in SIRENS.items()}
+CAMERAS_DESC = {name: f"{description} ({name})" for name, description in CAMERAS.items()}
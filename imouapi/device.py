@@ -2,20 +2,24 @@
 import asyncio
 import logging
 import re
-from typing import Any, Union
+import time
+from itertools import chain
+from typing import Any, Optional, Union
 
 from .api import ImouAPIClient
 from .const import (
-    BINARY_SENSORS,
-    BUTTONS,
+    BINARY_SENSORS_DESC,
+    BUTTONS_DESC,
     CAMERA_WAIT_BEFORE_DOWNLOAD,
-    CAMERAS,
-    IMOU_CAPABILITIES,
-    IMOU_SWITCHES,
+    CAMERAS_DESC,
+    IMOU_CAPABILITIES_DESC,
+    IMOU_SWITCHES_DESC,
+    IMOU_SWITCHES_LOWER,
     ONLINE_STATUS,
-    SELECT,
-    SENSORS,
-    SIRENS,
+    SELECT_DESC,
+    SENSORS_DESC,
+    SIRENS_DESC,
+    UPDATE_TTL,
     WAIT_AFTER_WAKE_UP,
 )
 from .device_entity import (
@@ -28,7 +32,7 @@ from .device_entity import (
     ImouSiren,
     ImouSwitch,
 )
-from .exceptions import InvalidResponse
+from .exceptions import APIError, InvalidResponse
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -36,6 +40,29 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 class ImouDevice:
     """A representation of an IMOU Device."""
 
+    __slots__ = (
+        "_api_client",
+        "_device_id",
+        "_catalog",
+        "_firmware",
+        "_name",
+        "_given_name",
+        "_device_model",
+        "_manufacturer",
+        "_status",
+        "_capabilities",
+        "_switches",
+        "_sensor_instances",
+        "_sensors_by_name",
+        "_initialized",
+        "_enabled",
+        "_sleepable",
+        "_wait_after_wakeup",
+        "_camera_wait_before_download",
+        "_update_ttl",
+        "_last_update_ts",
+    )
+
     def __init__(
         self,
         api_client: ImouAPIClient,
@@ -69,11 +96,14 @@ class ImouDevice:
             "siren": [],
             "camera": [],
         }
+        self._sensors_by_name: dict[str, Any] = {}
         self._initialized = False
         self._enabled = True
         self._sleepable = False
         self._wait_after_wakeup = WAIT_AFTER_WAKE_UP
         self._camera_wait_before_download = CAMERA_WAIT_BEFORE_DOWNLOAD
+        self._update_ttl = UPDATE_TTL
+        self._last_update_ts: Optional[float] = None
 
     def get_device_id(self) -> str:
         """Get device id."""
@@ -119,14 +149,7 @@ class ImouDevice:
 
     def get_all_sensors(self) -> list[ImouEntity]:
         """Get all the sensor instances."""
-        sensors = []
-        for (
-            platform,  # pylint: disable=unused-variable
-            sensor_instances_array,
-        ) in self._sensor_instances.items():
-            for sensor_instance in sensor_instances_array:
-                sensors.append(sensor_instance)
-        return sensors
+        return list(chain.from_iterable(self._sensor_instances.values()))
 
     def get_sensors_by_platform(self, platform: str) -> list[ImouEntity]:
         """Get sensor instances associated to a given platform."""
@@ -138,14 +161,7 @@ class ImouDevice:
         self, name: str
     ) -> Union[ImouSensor, ImouBinarySensor, ImouSwitch, ImouSelect, ImouButton, None]:
         """Get sensor instance with a given name."""
-        for (
-            platform,  # pylint: disable=unused-variable
-            sensor_instances_array,
-        ) in self._sensor_instances.items():
-            for sensor_instance in sensor_instances_array:
-                if sensor_instance.get_name() == name:
-                    return sensor_instance
-        return None
+        return self._sensors_by_name.get(name)
 
     def set_enabled(self, value: bool) -> None:
         """Set enable."""
@@ -171,25 +187,40 @@ class ImouDevice:
         """Get camera wait before download."""
         return self._camera_wait_before_download
 
+    def set_update_ttl(self, value: float) -> None:
+        """Set the minimum time between two updates of the sensors."""
+        self._update_ttl = value
+
+    def get_update_ttl(self) -> float:
+        """Get the minimum time between two updates of the sensors."""
+        return self._update_ttl
+
     def _add_sensor_instance(self, platform, instance):
         """Add a sensor instance."""
         instance.set_device(self)
         self._sensor_instances[platform].append(instance)
+        self._sensors_by_name.setdefault(instance.get_name(), instance)
 
     async def async_initialize(self) -> None:
         """Initialize the instance by retrieving the device details and associated sensors."""
         # get the details for this device from the API
         device_array = await self._api_client.async_api_deviceBaseDetailList([self._device_id])
-        if "deviceList" not in device_array or len(device_array["deviceList"]) != 1:
-            raise InvalidResponse(f"deviceList not found in {str(device_array)}")
         # reponse is an array, our data is in the first element
-        device_data = device_array["deviceList"][0]
+        try:
+            device_data = device_array["deviceList"][0]
+        except (KeyError, IndexError) as exception:
+            raise InvalidResponse(f"deviceList not found in {device_array}") from exception
+        self._populate_from_data(device_data)
+
+    def _populate_from_data(self, device_data: dict) -> None:
+        """Initialize the instance from the device details returned by the API and create associated sensors."""
         try:
             # get device details
             self._catalog = device_data["catalog"]
             self._firmware = device_data["version"]
             self._name = device_data["name"]
             self._device_model = device_data["deviceModel"]
+            device_name = self.get_name()
             # get device capabilities
             self._capabilities = device_data["ability"].split(",")
             # Add undocumented capabilities or capabilities inherited from other capabilities
@@ -198,26 +229,23 @@ class ImouDevice:
                 self._capabilities.append("Linkagewhitelight")
             if "WLAN" in self._capabilities:
                 self._capabilities.append("pushNotifications")
-            switches_keys = IMOU_SWITCHES.keys()
+            # normalize the capabilities (lowercase, without version suffix) once
+            capabilities_lower = {re.sub("v\\d$", '', capability.lower()) for capability in self._capabilities}
             # add switches. For each possible switch, check if there is a capability with the same name \
             # (ref. https://open.imoulife.com/book/en/faq/feature.html)
-            for switch_type in switches_keys:
-                for capability in self._capabilities:
-                    capability = capability.lower()
-                    capability = re.sub("v\\d$", '', capability)
-                    if switch_type.lower() == capability and switch_type.lower() not in self._switches:
-                        self._switches.append(switch_type)
-                        # create an instance and save it
-                        self._add_sensor_instance(
-                            "switch",
-                            ImouSwitch(
-                                self._api_client,
-                                self._device_id,
-                                self.get_name(),
-                                switch_type,
-                            ),
-                        )
-                        break
+            for switch_type_lower, switch_type in IMOU_SWITCHES_LOWER.items():
+                if switch_type_lower in capabilities_lower and switch_type not in self._switches:
+                    self._switches.append(switch_type)
+                    # create an instance and save it
+                    self._add_sensor_instance(
+                        "switch",
+                        ImouSwitch(
+                            self._api_client,
+                            self._device_id,
+                            device_name,
+                            switch_type,
+                        ),
+                    )
             # identify sleepable devices
             if "Dormant" in self._capabilities:
                 self._sleepable = True
@@ -226,7 +254,7 @@ class ImouDevice:
                     ImouSensor(
                         self._api_client,
                         self._device_id,
-                        self.get_name(),
+                        device_name,
                         "battery",
                     ),
                 )
@@ -237,7 +265,7 @@ class ImouDevice:
                     ImouSensor(
                         self._api_client,
                         self._device_id,
-                        self.get_name(),
+                        device_name,
                         "storageUsed",
                     ),
                 )
@@ -247,7 +275,7 @@ class ImouDevice:
                 ImouSensor(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "callbackUrl",
                 ),
             )
@@ -257,7 +285,7 @@ class ImouDevice:
                 ImouSensor(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "status",
                 ),
             )
@@ -268,7 +296,7 @@ class ImouDevice:
                     ImouBinarySensor(
                         self._api_client,
                         self._device_id,
-                        self.get_name(),
+                        device_name,
                         "online",
                     ),
                 )
@@ -279,7 +307,7 @@ class ImouDevice:
                     ImouBinarySensor(
                         self._api_client,
                         self._device_id,
-                        self.get_name(),
+                        device_name,
                         "motionAlarm",
                     ),
                 )
@@ -290,7 +318,7 @@ class ImouDevice:
                     ImouSelect(
                         self._api_client,
                         self._device_id,
-                        self.get_name(),
+                        device_name,
                         "nightVisionMode",
                     ),
                 )
@@ -300,7 +328,7 @@ class ImouDevice:
                 ImouButton(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "restartDevice",
                 ),
             )
@@ -310,7 +338,7 @@ class ImouDevice:
                 ImouButton(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "refreshData",
                 ),
             )
@@ -320,7 +348,7 @@ class ImouDevice:
                 ImouButton(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "refreshAlarm",
                 ),
             )
@@ -331,7 +359,7 @@ class ImouDevice:
                     ImouSiren(
                         self._api_client,
                         self._device_id,
-                        self.get_name(),
+                        device_name,
                         "siren",
                     ),
                 )
@@ -341,7 +369,7 @@ class ImouDevice:
                 ImouCamera(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "camera",
                     "HD",
                 ),
@@ -351,7 +379,7 @@ class ImouDevice:
                 ImouCamera(
                     self._api_client,
                     self._device_id,
-                    self.get_name(),
+                    device_name,
                     "cameraSD",
                     "SD",
                 ),
@@ -359,16 +387,21 @@ class ImouDevice:
         except Exception as exception:
             raise InvalidResponse(f" missing parameter or error parsing in {device_data}") from exception
         _LOGGER.debug("Retrieved device %s", self.to_string())
-        _LOGGER.debug("Device details:\n%s", self.dump())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Device details:\n%s", self.dump())
         # keep track that we have already asked for the device details
         self._initialized = True
 
     async def async_refresh_status(self) -> None:
         """Refresh status attribute."""
         data = await self._api_client.async_api_deviceOnline(self._device_id)
-        if "onLine" not in data or data["onLine"] not in ONLINE_STATUS:
+        try:
+            status = data["onLine"]
+        except KeyError as exception:
+            raise InvalidResponse(f"onLine not valid in {data}") from exception
+        if status not in ONLINE_STATUS:
             raise InvalidResponse(f"onLine not valid in {data}")
-        self._status = data["onLine"]
+        self._status = status
 
     async def async_wakeup(self) -> bool:
         """Wake up a dormant device."""
@@ -392,8 +425,13 @@ class ImouDevice:
         _LOGGER.warning("[%s] failed to wake up dormant device", self.get_name())
         return False
 
-    async def async_get_data(self) -> bool:
-        """Update device properties and its sensors."""
+    async def async_get_data(self, force: bool = False) -> bool:
+        """
+        Update device properties and its sensors.
+
+        Parameters:
+            force: update the sensors even if they have been updated less than update_ttl seconds ago
+        """
         if not self._enabled:
             return False
         if not self._initialized:
@@ -402,130 +440,67 @@ class ImouDevice:
         _LOGGER.debug("[%s] update requested", self.get_name())
 
         # check if the device is online
+        was_online = self.is_online()
         await self.async_refresh_status()
+        if not self.is_online():
+            return True
 
-        # update the status of all the sensors (if the device is online)
-        if self.is_online():
-            for (
-                platform,  # pylint: disable=unused-variable
-                sensor_instances_array,
-            ) in self._sensor_instances.items():
-                for sensor_instance in sensor_instances_array:
-                    await sensor_instance.async_update()
+        # skip updating the sensors if recently updated and the device has not come back online in the meantime
+        # (online and dormant are both considered online, a sleepable device alternates between the two)
+        if (
+            not force
+            and was_online
+            and self._last_update_ts is not None
+            and time.monotonic() - self._last_update_ts < self._update_ttl
+        ):
+            _LOGGER.debug("[%s] sensors recently updated, skipping", self.get_name())
+            return True
+
+        # update the status of all the sensors, waking up a dormant device once before updating them concurrently
+        if not await self.async_wakeup():
+            return True
+        sensor_instances = self.get_all_sensors()
+        results = await asyncio.gather(
+            *(sensor_instance.async_update(wakeup=False) for sensor_instance in sensor_instances),
+            return_exceptions=True,
+        )
+        # let every sensor complete its update, then raise the first error
+        errors = []
+        for sensor_instance, result in zip(sensor_instances, results):
+            if isinstance(result, BaseException):
+                _LOGGER.debug("[%s] failed to update %s: %s", self.get_name(), sensor_instance.get_name(), result)
+                errors.append(result)
+        if errors:
+            raise errors[0]
+        self._last_update_ts = time.monotonic()
         return True
 
     def to_string(self) -> str:
         """Return the object as a string."""
         return f"{self._name} ({self._device_model}, serial {self._device_id})"
 
-    def get_diagnostics(self) -> dict[str, Any]:
-        """Return diagnostics for the device."""
-        # prepare capabilities
-        capabilities = []
-        for capability_name in self._capabilities:
-            capability = {}
-            description = (
-                f"{IMOU_CAPABILITIES[capability_name]} ({capability_name})"
-                if capability_name in IMOU_CAPABILITIES
-                else capability_name
-            )
-            capability["name"] = capability_name
-            capability["description"] = description
-            capabilities.append(capability)
-        # prepare switches
-        switches = []
-        for sensor_instance in self._sensor_instances["switch"]:
-            sensor = {}
-            sensor_name = sensor_instance.get_name()
-            description = (
-                f"{IMOU_SWITCHES[sensor_name]} ({sensor_name})" if sensor_name in IMOU_SWITCHES else sensor_name
-            )
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["state"] = sensor_instance.is_on()
-            sensor["is_enabled"] = sensor_instance.is_enabled()
-            sensor["is_updated"] = sensor_instance.is_updated()
-            sensor["attributes"] = sensor_instance.get_attributes()
-            switches.append(sensor)
-        # prepare sensors
+    def _get_sensors_diagnostics(
+        self, platform: str, descriptions: dict[str, str], state_getters: dict[str, str]
+    ) -> list[dict[str, Any]]:
+        """Build diagnostics for the sensors of a platform, reading the given state fields from their getters."""
         sensors = []
-        for sensor_instance in self._sensor_instances["sensor"]:
-            sensor = {}
+        for sensor_instance in self._sensor_instances[platform]:
             sensor_name = sensor_instance.get_name()
-            description = f"{SENSORS[sensor_name]} ({sensor_name})"
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["state"] = sensor_instance.get_state()
+            sensor = {
+                "name": sensor_name,
+                "description": descriptions.get(sensor_name, sensor_name),
+            }
+            for field, getter in state_getters.items():
+                sensor[field] = getattr(sensor_instance, getter)()
             sensor["is_enabled"] = sensor_instance.is_enabled()
             sensor["is_updated"] = sensor_instance.is_updated()
             sensor["attributes"] = sensor_instance.get_attributes()
             sensors.append(sensor)
-        # prepare binary sensors
-        binary_sensors = []
-        for sensor_instance in self._sensor_instances["binary_sensor"]:
-            sensor = {}
-            sensor_name = sensor_instance.get_name()
-            description = f"{BINARY_SENSORS[sensor_name]} ({sensor_name})"
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["state"] = sensor_instance.is_on()
-            sensor["is_enabled"] = sensor_instance.is_enabled()
-            sensor["is_updated"] = sensor_instance.is_updated()
-            sensor["attributes"] = sensor_instance.get_attributes()
-            binary_sensors.append(sensor)
-        # prepare select
-        selects = []
-        for sensor_instance in self._sensor_instances["select"]:
-            sensor = {}
-            sensor_name = sensor_instance.get_name()
-            description = f"{SELECT[sensor_name]} ({sensor_name})"
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["current_option"] = sensor_instance.get_current_option()
-            sensor["available_options"] = sensor_instance.get_available_options()
-            sensor["is_enabled"] = sensor_instance.is_enabled()
-            sensor["is_updated"] = sensor_instance.is_updated()
-            sensor["attributes"] = sensor_instance.get_attributes()
-            selects.append(sensor)
-        # prepare button
-        buttons = []
-        for sensor_instance in self._sensor_instances["button"]:
-            sensor = {}
-            sensor_name = sensor_instance.get_name()
-            description = f"{BUTTONS[sensor_name]} ({sensor_name})"
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["is_enabled"] = sensor_instance.is_enabled()
-            sensor["is_updated"] = sensor_instance.is_updated()
-            sensor["attributes"] = sensor_instance.get_attributes()
-            buttons.append(sensor)
-        # prepare sirens
-        sirens = []
-        for sensor_instance in self._sensor_instances["siren"]:
-            sensor = {}
-            sensor_name = sensor_instance.get_name()
-            description = f"{SIRENS[sensor_name]} ({sensor_name})" if sensor_name in SIRENS else sensor_name
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["state"] = sensor_instance.is_on()
-            sensor["is_enabled"] = sensor_instance.is_enabled()
-            sensor["is_updated"] = sensor_instance.is_updated()
-            sensor["attributes"] = sensor_instance.get_attributes()
-            sirens.append(sensor)
-        # prepare cameras
-        cameras = []
-        for sensor_instance in self._sensor_instances["camera"]:
-            sensor = {}
-            sensor_name = sensor_instance.get_name()
-            description = f"{CAMERAS[sensor_name]} ({sensor_name})" if sensor_name in CAMERAS else sensor_name
-            sensor["name"] = sensor_name
-            sensor["description"] = description
-            sensor["is_enabled"] = sensor_instance.is_enabled()
-            sensor["is_updated"] = sensor_instance.is_updated()
-            sensor["attributes"] = sensor_instance.get_attributes()
-            cameras.append(sensor)
-        # prepare data structure to return
-        data: dict[str, Any] = {
+        return sensors
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics for the device."""
+        return {
             "api": {
                 "base_url": self._api_client.get_base_url(),
                 "timeout": self._api_client.get_timeout(),
@@ -542,75 +517,77 @@ class ImouDevice:
                 "status": self._status,
                 "sleepable": self._sleepable,
             },
-            "capabilities": capabilities,
-            "switches": switches,
-            "sensors": sensors,
-            "binary_sensors": binary_sensors,
-            "selects": selects,
-            "buttons": buttons,
-            "sirens": sirens,
-            "cameras": cameras,
+            "capabilities": [
+                {
+                    "name": capability_name,
+                    "description": IMOU_CAPABILITIES_DESC.get(capability_name, capability_name),
+                }
+                for capability_name in self._capabilities
+            ],
+            "switches": self._get_sensors_diagnostics("switch", IMOU_SWITCHES_DESC, {"state": "is_on"}),
+            "sensors": self._get_sensors_diagnostics("sensor", SENSORS_DESC, {"state": "get_state"}),
+            "binary_sensors": self._get_sensors_diagnostics("binary_sensor", BINARY_SENSORS_DESC, {"state": "is_on"}),
+            "selects": self._get_sensors_diagnostics(
+                "select",
+                SELECT_DESC,
+                {"current_option": "get_current_option", "available_options": "get_available_options"},
+            ),
+            "buttons": self._get_sensors_diagnostics("button", BUTTONS_DESC, {}),
+            "sirens": self._get_sensors_diagnostics("siren", SIRENS_DESC, {"state": "is_on"}),
+            "cameras": self._get_sensors_diagnostics("camera", CAMERAS_DESC, {}),
         }
-        return data
 
     def dump(self) -> str:
         """Return the full description of the object and its attributes."""
         data = self.get_diagnostics()
-        dump = (
-            f"- Device ID: {data['device']['device_id']}\n"
-            + f"    Name: {data['device']['name']}\n"
-            + f"    Catalog: {data['device']['catalog']}\n"
-            + f"    Model: {data['device']['model']}\n"
-            + f"    Firmware: {data['device']['firmware']}\n"
-            + f"    Status: {ONLINE_STATUS[data['device']['status']]}\n"
-            + f"    Sleepable: {data['device']['sleepable']}\n"
-        )
-        dump = dump + "    Capabilities: \n"
+        lines = [
+            f"- Device ID: {data['device']['device_id']}",
+            f"    Name: {data['device']['name']}",
+            f"    Catalog: {data['device']['catalog']}",
+            f"    Model: {data['device']['model']}",
+            f"    Firmware: {data['device']['firmware']}",
+            f"    Status: {ONLINE_STATUS[data['device']['status']]}",
+            f"    Sleepable: {data['device']['sleepable']}",
+        ]
+        lines.append("    Capabilities: ")
         for capability in data['capabilities']:
-            dump = dump + f"        - {capability['description']}\n"
-        dump = dump + "    Switches: \n"
+            lines.append(f"        - {capability['description']}")
+        lines.append("    Switches: ")
         for sensor in data['switches']:
-            dump = (
-                dump
-                + f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        dump = dump + "    Sensors: \n"
+        lines.append("    Sensors: ")
         for sensor in data['sensors']:
-            dump = (
-                dump
-                + f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        dump = dump + "    Binary Sensors: \n"
+        lines.append("    Binary Sensors: ")
         for sensor in data['binary_sensors']:
-            dump = (
-                dump
-                + f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        dump = dump + "    Select: \n"
+        lines.append("    Select: ")
         for sensor in data['selects']:
-            dump = (
-                dump
-                + f"        - {sensor['description']}: {sensor['current_option']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']}: {sensor['current_option']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        dump = dump + "    Buttons: \n"
+        lines.append("    Buttons: ")
         for sensor in data['buttons']:
-            dump = (
-                dump
-                + f"        - {sensor['description']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        dump = dump + "    Sirens: \n"
+        lines.append("    Sirens: ")
         for sensor in data['sirens']:
-            dump = (
-                dump
-                + f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']}: {sensor['state']} {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        dump = dump + "    Cameras: \n"
+        lines.append("    Cameras: ")
         for sensor in data['cameras']:
-            dump = (
-                dump
-                + f"        - {sensor['description']}: {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}\n"  # noqa: E501
+            lines.append(
+                f"        - {sensor['description']}: {sensor['attributes'] if len(sensor['attributes']) > 0 else ''}"  # noqa: E501
             )
-        return dump
+        return "\n".join(lines) + "\n"
 
 
 class ImouDiscoverService:
@@ -633,12 +610,45 @@ class ImouDiscoverService:
         if "deviceList" not in devices_data or "count" not in devices_data:
             raise InvalidResponse(f"deviceList or count not found in {devices_data}")
         _LOGGER.debug("Discovered %d registered devices", devices_data["count"])
-        # extract the device id for each device
-        devices = {}
-        for device_data in devices_data["deviceList"]:
-            # create a a device instance from the device id and initialize it
-            device = ImouDevice(self._api_client, device_data["deviceId"])
-            await device.async_initialize()
+        # create a device instance from the device id of each device
+        discovered_devices = [
+            ImouDevice(self._api_client, device_data["deviceId"]) for device_data in devices_data["deviceList"]
+        ]
+        devices: dict[str, ImouDevice] = {}
+        if len(discovered_devices) == 0:
+            return devices
+        results: list[Optional[BaseException]] = []
+        try:
+            # get the details of all the devices with a single request
+            details_data = await self._api_client.async_api_deviceBaseDetailList(
+                [device.get_device_id() for device in discovered_devices]
+            )
+            if "deviceList" not in details_data:
+                raise InvalidResponse(f"deviceList not found in {details_data}")
+        except (APIError, InvalidResponse) as exception:
+            # fall back to initializing each device on its own so that one bad device does not abort the discovery
+            _LOGGER.warning("Unable to retrieve the details of all the devices, retrying one by one: %s", exception)
+            results = await asyncio.gather(
+                *(device.async_initialize() for device in discovered_devices),
+                return_exceptions=True,
+            )
+        else:
+            details_by_id = {device_data.get("deviceId"): device_data for device_data in details_data["deviceList"]}
+            for device in discovered_devices:
+                device_id = device.get_device_id()
+                # initialize the device from its details
+                try:
+                    if device_id not in details_by_id:
+                        raise InvalidResponse(f"details not found for device {device_id}")
+                    device._populate_from_data(details_by_id[device_id])  # pylint: disable=protected-access
+                    results.append(None)
+                except InvalidResponse as exception:
+                    results.append(exception)
+        for device, result in zip(discovered_devices, results):
+            # skip devices which failed to initialize
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Unable to initialize device %s: %s", device.get_device_id(), result)
+                continue
             _LOGGER.debug("   - %s", device.to_string())
             devices[f"{device.get_name()}"] = device
         # return a dict with device name -> device instance
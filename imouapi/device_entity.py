@@ -76,13 +76,13 @@ class ImouEntity(ABC):
         """Entity attributes."""
         return self._attributes
 
-    async def _async_is_ready(self) -> bool:
-        """Check if the sensor is fully ready."""
+    async def _async_is_ready(self, wakeup: bool = True) -> bool:
+        """Check if the sensor is fully ready, waking up the device unless already done by the caller."""
         # check if the sensor is enabled
         if not self._enabled:
             return False
         # wake up the device if a dormant device and sleeping
-        if self._device_instance is not None:
+        if wakeup and self._device_instance is not None:
             awake = await self._device_instance.async_wakeup()
             if awake:
                 return True
@@ -119,7 +119,7 @@ class ImouSensor(ImouEntity):
 
     async def async_update(self, **kwargs):
         """Update the entity."""
-        if not await self._async_is_ready():
+        if not await self._async_is_ready(kwargs.get("wakeup", True)):
             return
 
         # storageUsed sensor
@@ -209,7 +209,7 @@ class ImouBinarySensor(ImouEntity):
 
     async def async_update(self, **kwargs):
         """Update the entity."""
-        if not await self._async_is_ready():
+        if not await self._async_is_ready(kwargs.get("wakeup", True)):
             return
 
         # online sensor
@@ -282,7 +282,7 @@ class ImouSwitch(ImouEntity):
 
     async def async_update(self, **kwargs):
         """Update the entity."""
-        if not await self._async_is_ready():
+        if not await self._async_is_ready(kwargs.get("wakeup", True)):
             return
 
         # pushNotifications sensor
@@ -373,7 +373,7 @@ class ImouSelect(ImouEntity):
 
     async def async_update(self, **kwargs):
         """Update the entity."""
-        if not await self._async_is_ready():
+        if not await self._async_is_ready(kwargs.get("wakeup", True)):
             return
 
         if self._name == "nightVisionMode":
@@ -479,7 +479,7 @@ class ImouSiren(ImouEntity):
 
     async def async_update(self, **kwargs):
         """Update the entity."""
-        if not await self._async_is_ready():
+        if not await self._async_is_ready(kwargs.get("wakeup", True)):
             return
 
         # siren sensor
@@ -547,7 +547,7 @@ class ImouCamera(ImouEntity):
 
     async def async_update(self, **kwargs):
         """Update the entity."""
-        if not await self._async_is_ready():
+        if not await self._async_is_ready(kwargs.get("wakeup", True)):
             return
 
     async def async_get_image(self) -> Union[bytes, None]:
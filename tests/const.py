@@ -59,6 +59,30 @@ MOCK_RESPONSES = {
         },
         "id": "26",
     },
+    "deviceBaseList_two_devices": {
+        "result": {
+            "msg": "Operation is successful.",
+            "code": "0",
+            "data": {
+                "count": 2,
+                "deviceList": [
+                    {
+                        "channels": [{"channelName": "8L0DF93PAZ55FD2-1", "channelId": "0"}],
+                        "deviceId": "8L0DF93PAZ55FD2",
+                        "bindId": 1,
+                        "aplist": [],
+                    },
+                    {
+                        "channels": [{"channelName": "9K1EG04QBA66GE3-1", "channelId": "0"}],
+                        "deviceId": "9K1EG04QBA66GE3",
+                        "bindId": 2,
+                        "aplist": [],
+                    },
+                ],
+            },
+        },
+        "id": "26",
+    },
     "deviceBaseList_wrong_device_id": {"result": {"msg": "No right, cannot operate.", "code": "OP1009"}, "id": "23"},
     "deviceBaseList_malformed": {
         "result": {
@@ -135,6 +159,37 @@ MOCK_RESPONSES = {
         },
         "id": "21",
     },
+    "deviceBaseDetailList_two_devices": {
+        "result": {
+            "msg": "Operation is successful.",
+            "code": "0",
+            "data": {
+                "count": 2,
+                "deviceList": [
+                    {
+                        "catalog": "IPC",
+                        "deviceId": "9K1EG04QBA66GE3",
+                        "version": "2.800.0000000.10.R.230101",
+                        "name": "doorbell",
+                        "deviceModel": "DB11",
+                        "ability": "WLAN,Dormant,LocalStorage,AlarmMD",
+                        "status": "online",
+                    },
+                    {
+                        "catalog": "IPC",
+                        "deviceId": "8L0DF93PAZ55FD2",
+                        "version": "2.680.0000000.25.R.220527",
+                        "name": "webcam",
+                        "deviceModel": "IPC-C22C",
+                        "ability": "WLAN,Siren,LocalStorage,BreathingLight,AlarmMD,HeaderDetect,NVM",
+                        "status": "online",
+                    },
+                ],
+            },
+        },
+        "id": "21",
+    },
+    "deviceBaseDetailList_error": {"result": {"msg": "Error.", "code": "200"}, "id": "21"},
     "deviceBaseDetailList_missing_data": {
         "result": {
             "msg": "Operation is successful.",
@@ -240,6 +295,14 @@ MOCK_RESPONSES = {
         },
         "id": "8",
     },
+    "deviceOnline_dormant": {
+        "result": {
+            "msg": "Operation is successful.",
+            "code": "0",
+            "data": {"channels": [{"channelId": "0", "onLine": "4"}], "deviceId": "8L0DF93PAZ55FD2", "onLine": "4"},
+        },
+        "id": "8",
+    },
     "deviceOnline_malformed": {
         "result": {
             "msg": "Operation is successful.",
@@ -37,6 +37,10 @@ class TestDevice:
         payload = MOCK_RESPONSES[response] if response in MOCK_RESPONSES else "{invalid"
         mocked.post(re.compile(r".+/" + url + "$"), status=status, payload=payload, exception=exception, repeat=repeat)
 
+    def count_requests(self, mocked, url: str) -> int:
+        """Count the requests sent to a mocked api."""
+        return sum(len(calls) for (method, request), calls in mocked.requests.items() if request.path.endswith(url))
+
     def configure_responses_ok(self, mocked):
         """Configure all responses ok."""
         self.config_mock(mocked, "accessToken", "accessToken_ok", repeat=True)
@@ -73,6 +77,43 @@ class TestDevice:
                 self.loop.run_until_complete(discover_service.async_discover_devices())
             assert "InvalidResponse" in str(exception) and "not found in" in str(exception)
 
+    def test_discover_device_error(self):
+        """Test ImouDiscoverService: device failing to initialize is skipped."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok")
+            self.config_mock(mocked, "deviceBaseList", "deviceBaseList_ok")
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_missing_data")
+            discover_service = ImouDiscoverService(self.api_client)
+            discovered_devices = self.loop.run_until_complete(discover_service.async_discover_devices())
+            assert discovered_devices == {}
+
+    def test_discover_two_devices(self):
+        """Test ImouDiscoverService: details of all the devices retrieved with a single request."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok")
+            self.config_mock(mocked, "deviceBaseList", "deviceBaseList_two_devices")
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_two_devices")
+            discover_service = ImouDiscoverService(self.api_client)
+            discovered_devices = self.loop.run_until_complete(discover_service.async_discover_devices())
+            assert self.count_requests(mocked, "deviceBaseDetailList") == 1
+            assert discovered_devices["webcam"].get_device_id() == "8L0DF93PAZ55FD2"
+            assert discovered_devices["webcam"].get_model() == "IPC-C22C"
+            assert discovered_devices["doorbell"].get_device_id() == "9K1EG04QBA66GE3"
+            assert discovered_devices["doorbell"].get_sleepable() is True
+
+    def test_discover_batch_error(self):
+        """Test ImouDiscoverService: devices initialized one by one if the single request fails."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok")
+            self.config_mock(mocked, "deviceBaseList", "deviceBaseList_two_devices")
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_error")
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_ok")
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_missing_data")
+            discover_service = ImouDiscoverService(self.api_client)
+            discovered_devices = self.loop.run_until_complete(discover_service.async_discover_devices())
+            assert self.count_requests(mocked, "deviceBaseDetailList") == 3
+            assert list(discovered_devices.keys()) == ["webcam"]
+
     def test_get_device_ok(self):
         """Test get device: ok."""
         with aioresponses() as mocked:
@@ -219,3 +260,119 @@ class TestDevice:
             assert siren.is_on() is True
             self.loop.run_until_complete(siren.async_turn_off())
             assert siren.is_on() is False
+
+    def test_get_data_sensor_error(self):
+        """Test get data: a failing sensor does not prevent the others from being updated."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok", repeat=True)
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_ok")
+            device = ImouDevice(self.api_client, "8L0DF93PAZ55FD2")
+            self.loop.run_until_complete(device.async_initialize())
+            self.config_mock(mocked, "deviceOnline", "deviceOnline_ok", repeat=True)
+            self.config_mock(mocked, "getDeviceCameraStatus", "getDeviceCameraStatus_ok", repeat=True)
+            self.config_mock(mocked, "deviceStorage", "deviceStorage_ok")
+            self.config_mock(mocked, "getAlarmMessage", "getAlarmMessage_ok")
+            self.config_mock(mocked, "getNightVisionMode", "getNightVisionMode_malformed")
+            self.config_mock(mocked, "getMessageCallback", "getMessageCallback_ok", repeat=True)
+            self.config_mock(mocked, "deviceSdcardStatus", "deviceSdcardStatus_ok")
+            with pytest.raises(Exception) as exception:
+                self.loop.run_until_complete(device.async_get_data())
+            assert "InvalidResponse" in str(exception)
+            assert device.get_sensor_by_name("breathingLight").is_on() is True
+            assert device.get_sensor_by_name("online").is_on() is True
+
+    def test_diagnostics(self):
+        """Test diagnostics: reflect the current state of the device and its sensors."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok")
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_ok")
+            self.config_mock(mocked, "setDeviceCameraStatus", "setDeviceCameraStatus_ok", repeat=True)
+            device = ImouDevice(self.api_client, "8L0DF93PAZ55FD2")
+            self.loop.run_until_complete(device.async_initialize())
+            diagnostics = device.get_diagnostics()
+            assert diagnostics == device.get_diagnostics()
+            # altering the returned diagnostics does not alter the next ones
+            diagnostics["switches"].clear()
+            assert len(device.get_diagnostics()["switches"]) > 0
+            device.set_name("renamed")
+            assert device.get_diagnostics()["device"]["given_name"] == "renamed"
+            set_switch = device.get_sensor_by_name("headerDetect")
+            self.loop.run_until_complete(set_switch.async_turn_on())
+            switches = {switch["name"]: switch for switch in device.get_diagnostics()["switches"]}
+            assert switches["headerDetect"]["state"] is True
+
+    def test_get_data_update_ttl(self):
+        """Test get data: sensors not updated again within the update ttl unless forced."""
+        with aioresponses() as mocked:
+            self.configure_responses_ok(mocked)
+            device = ImouDevice(self.api_client, "8L0DF93PAZ55FD2")
+            # by default the sensors are updated every time
+            self.loop.run_until_complete(device.async_get_data())
+            updates = self.count_requests(mocked, "getDeviceCameraStatus")
+            assert updates > 0
+            self.loop.run_until_complete(device.async_get_data())
+            assert self.count_requests(mocked, "getDeviceCameraStatus") == 2 * updates
+            # within the ttl the sensors are only updated when forced
+            device.set_update_ttl(60)
+            self.loop.run_until_complete(device.async_get_data())
+            assert self.count_requests(mocked, "getDeviceCameraStatus") == 2 * updates
+            self.loop.run_until_complete(device.async_get_data(force=True))
+            assert self.count_requests(mocked, "getDeviceCameraStatus") == 3 * updates
+
+    def test_get_data_update_ttl_sleepable(self):
+        """Test get data: the update ttl applies to a sleepable device going back to dormant."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok", repeat=True)
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_ok")
+            # online during the first update, dormant afterwards
+            for _ in range(4):
+                self.config_mock(mocked, "deviceOnline", "deviceOnline_ok")
+            self.config_mock(mocked, "deviceOnline", "deviceOnline_dormant", repeat=True)
+            self.config_mock(mocked, "getAlarmMessage", "getAlarmMessage_ok", repeat=True)
+            self.config_mock(mocked, "getDeviceCameraStatus", "getDeviceCameraStatus_ok", repeat=True)
+            self.config_mock(mocked, "setDeviceCameraStatus", "setDeviceCameraStatus_ok", repeat=True)
+            self.config_mock(mocked, "deviceStorage", "deviceStorage_ok", repeat=True)
+            self.config_mock(mocked, "getNightVisionMode", "getNightVisionMode_ok", repeat=True)
+            self.config_mock(mocked, "getMessageCallback", "getMessageCallback_ok", repeat=True)
+            self.config_mock(mocked, "deviceSdcardStatus", "deviceSdcardStatus_ok", repeat=True)
+            device = ImouDevice(self.api_client, "8L0DF93PAZ55FD2")
+            self.loop.run_until_complete(device.async_initialize())
+            device._sleepable = True  # pylint: disable=protected-access
+            device.set_wait_after_wakeup(0)
+            device.set_update_ttl(60)
+            self.loop.run_until_complete(device.async_get_data())
+            updates = self.count_requests(mocked, "getDeviceCameraStatus")
+            self.loop.run_until_complete(device.async_get_data())
+            assert device.get_status() == "4"
+            assert self.count_requests(mocked, "setDeviceCameraStatus") == 0
+            assert self.count_requests(mocked, "getDeviceCameraStatus") == updates
+
+    def test_get_data_dormant(self):
+        """Test get data: a device failing to wake up is woken up once and its sensors are not updated."""
+        with aioresponses() as mocked:
+            self.config_mock(mocked, "accessToken", "accessToken_ok", repeat=True)
+            self.config_mock(mocked, "deviceBaseDetailList", "deviceBaseDetailList_ok")
+            self.config_mock(mocked, "deviceOnline", "deviceOnline_dormant", repeat=True)
+            self.config_mock(mocked, "setDeviceCameraStatus", "setDeviceCameraStatus_ok", repeat=True)
+            self.config_mock(mocked, "getDeviceCameraStatus", "getDeviceCameraStatus_ok", repeat=True)
+            device = ImouDevice(self.api_client, "8L0DF93PAZ55FD2")
+            self.loop.run_until_complete(device.async_initialize())
+            device._sleepable = True  # pylint: disable=protected-access
+            device.set_wait_after_wakeup(0)
+            assert self.loop.run_until_complete(device.async_get_data()) is True
+            assert self.count_requests(mocked, "setDeviceCameraStatus") == 1
+            assert self.count_requests(mocked, "getDeviceCameraStatus") == 0
+            assert device.get_sensor_by_name("breathingLight").is_updated() is False
+
+    def test_get_data_sleepable_online(self):
+        """Test get data: the sensors of an online sleepable device do not wake it up again."""
+        with aioresponses() as mocked:
+            self.configure_responses_ok(mocked)
+            device = ImouDevice(self.api_client, "8L0DF93PAZ55FD2")
+            self.loop.run_until_complete(device.async_initialize())
+            device._sleepable = True  # pylint: disable=protected-access
+            self.loop.run_until_complete(device.async_get_data())
+            # status check, wake up check and the online and status sensors
+            assert self.count_requests(mocked, "deviceOnline") == 4
+            assert self.count_requests(mocked, "setDeviceCameraStatus") == 0
+            assert device.get_sensor_by_name("breathingLight").is_on() is True